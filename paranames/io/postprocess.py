@@ -125,12 +125,22 @@ def apply_entity_disambiguation_rules(
 
 
 def remove_parentheses(
-    data: pd.DataFrame, english_column: str, label_column: str, regex: Pattern
+    data: pd.DataFrame,
+    english_column: str,
+    label_column: str,
+    parenthesis_regex: Pattern,
 ) -> pd.DataFrame:
-    data[english_column] = data[english_column].apply(
-        lambda e: regex.sub("", e).strip()
-    )
-    data[label_column] = data[label_column].apply(lambda a: regex.sub("", a).strip())
+    """Strips parenthesized text from the English and label columns.
+
+    `parenthesis_regex` must only match text containing "(", since
+    strings without one skip the regex entirely."""
+
+    def _remove(s: str) -> str:
+        # most names have no parentheses, so skip the regex engine for them
+        return parenthesis_regex.sub("", s).strip() if "(" in s else s.strip()
+
+    data[english_column] = data[english_column].apply(_remove)
+    data[label_column] = data[label_column].apply(_remove)
 
     return data
 
@@ -139,8 +149,10 @@ def collapse_language_codes(data, language_column: str = "language"):
     print(
         f"[collapse_language_codes] Collapsing all language codes across {data.shape[0]}..."
     )
-    collapsed = [l.split("-")[0] for l in data[language_column]]
-    data[language_column] = collapsed
+    # split each distinct code once; rows then share the resulting strings
+    codes = data[language_column]
+    collapsed = {code: code.split("-")[0] for code in codes.unique()}
+    data[language_column] = codes.map(collapsed)
 
     return data
 
@@ -233,7 +245,10 @@ def main(
     if should_remove_parentheses:
         re_parenthesis = re.compile(r"\(.*\)")
         data = remove_parentheses(
-            data, english_column="eng", label_column=label_column, regex=re_parenthesis
+            data,
+            english_column="eng",
+            label_column=label_column,
+            parenthesis_regex=re_parenthesis,
         )
 
     # collapse sub-languages into top-level language codes if needed
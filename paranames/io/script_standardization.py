@@ -14,6 +14,10 @@ import paranames.util.script as s
 from paranames.util import read, write
 
 
+# shared so its per-character tables persist across names
+unicode_analyzer = s.UnicodeAnalyzer(ignore_punctuation=True, ignore_numbers=True)
+
+
 def validate_name(
     name_language_tuple: Tuple[str, str],
     allowed_scripts: Dict[str, Dict[str, str]],
@@ -21,16 +25,14 @@ def validate_name(
 ) -> bool:
     name, language = name_language_tuple
 
-    ua = s.UnicodeAnalyzer(ignore_punctuation=True, ignore_numbers=True)
-
     if language not in allowed_scripts:
         return True
 
     return (
-        ua.most_common_icu_script(name)
+        unicode_analyzer.most_common_icu_script(name)
 
         if icu_mode
-        else ua.most_common_unicode_block(name)
+        else unicode_analyzer.most_common_unicode_block(name)
     ) in allowed_scripts[language]
 
 
@@ -1,41 +1,62 @@
 import csv
+import itertools
 import math
 import os
 import sys
-from collections import defaultdict
-from typing import IO, Iterable
+from typing import IO, AbstractSet, Any, Dict, Iterable, Iterator, Tuple
 
 import click
 from pymongo import MongoClient
 from tqdm import tqdm
 
-import paranames.util.wikidata as w
 from paranames.util import orjson_dump
 
 
+def unpack_document(document: Dict[str, Any]) -> Tuple[str, str, Dict[str, str]]:
+    """Reads the ID, English name and labels straight from a simple record.
+
+    Equivalent to going through `WikidataRecord(document, simple=True)`,
+    minus the per-document object construction."""
+    labels = document["labels"]
+
+    return document["id"], labels.get("en", ""), labels
+
+
+def filter_labels(
+    labels: Dict[str, str],
+    languages: Iterable[str],
+    not_languages: AbstractSet[str],
+    strict: bool = False,
+) -> Iterator[Tuple[str, str]]:
+    """Yields (language, label) pairs that pass the language filters.
+
+    In strict mode only the requested languages can pass, so we walk that
+    (usually short) list instead of every label of the document."""
+
+    if strict:
+        for lang in languages:
+            if lang in labels and lang not in not_languages:
+                yield lang, labels[lang]
+    else:
+        for lang, label in labels.items():
+            if lang not in not_languages:
+                yield lang, label
+
+
 def output_jsonl(
-    document: w.WikidataRecord,
+    document: Dict[str, Any],
     f: IO,
     languages: Iterable[str],
-    not_languages: Iterable[str],
+    not_languages: AbstractSet[str],
     conll_type: str,
     strict: bool = False,
     row_number: int = 0,
     *args,
     **kwargs,
 ) -> None:
-    wikidata_id = document.wikidata_id
-    name = document.name
-    language_set = set(languages)
-    not_language_set = set(not_languages)
+    wikidata_id, name, labels = unpack_document(document)
 
-    for lang, label in document.labels.items():
-
-        not_in_include_set = strict and lang not in language_set
-        in_exclude_set = lang in not_language_set
-
-        if not_in_include_set or in_exclude_set:
-            continue
+    for lang, label in filter_labels(labels, languages, not_languages, strict):
         row = orjson_dump(
             {
                 "wikidata_id": wikidata_id,
@@ -48,11 +69,14 @@ def output_jsonl(
         f.write(f"{row}\n")
 
 
+CSV_FIELD_NAMES = ("wikidata_id", "name", "label", "language", "type")
+
+
 def output_csv(
-    document: w.WikidataRecord,
+    document: Dict[str, Any],
     f: IO,
     languages: Iterable[str],
-    not_languages: Iterable[str],
+    not_languages: AbstractSet[str],
     conll_type: str,
     strict: bool = False,
     row_number: int = 0,
@@ -60,45 +84,25 @@ def output_csv(
     *args,
     **kwargs,
 ) -> None:
-    language_set = set(languages)
-    not_language_set = set(not_languages)
-    wikidata_id = document.wikidata_id
-    name = document.name
-    writer = csv.DictWriter(
-        f,
-        delimiter=delimiter,
-        fieldnames=["wikidata_id", "name", "label", "language", "type"],
-        extrasaction="ignore",
-    )
+    wikidata_id, name, labels = unpack_document(document)
+    writer = csv.writer(f, delimiter=delimiter)
 
     if row_number == 0:
-        writer.writeheader()
-
-    rows = (
-        {
-            "wikidata_id": wikidata_id,
-            "name": name,
-            "label": label,
-            "language": lang,
-            "type": conll_type,
-        }
-        for lang, label in document.labels.items()
+        writer.writerow(CSV_FIELD_NAMES)
+
+    writer.writerows(
+        (wikidata_id, name, label, lang, conll_type)
+        for lang, label in filter_labels(labels, languages, not_languages, strict)
     )
 
-    if strict:
-        rows = (
-            row
-            for row in rows
-            if row["language"] in language_set
-            and row["language"] not in not_language_set
-        )
-    else:
-        rows = (row for row in rows if row["language"] not in not_language_set)
 
-    writer.writerows(rows)
+# 1 MiB write buffer to keep syscalls down on multi-GB dumps
+OUTPUT_BUFFER_SIZE = 1 << 20
 
 
-def resolve_output_file(output_file: str, mode="a") -> IO:
+def resolve_output_file(
+    output_file: str, mode="a", buffer_size: int = OUTPUT_BUFFER_SIZE
+) -> IO:
 
     output_is_stdout = bool(not output_file or output_file == "-")
 
@@ -107,7 +111,7 @@ def resolve_output_file(output_file: str, mode="a") -> IO:
     else:
         abs_output = os.path.abspath(output_file)
 
-        return open(abs_output, mode, encoding="utf-8")
+        return open(abs_output, mode, encoding="utf-8", buffering=buffer_size)
 
 
 conll_type_to_wikidata_id = {"PER": "Q5", "LOC": "Q82794", "ORG": "Q43229"}
@@ -198,8 +202,9 @@ def main(
     # parse some input args
     languages = "" if languages == "-" else languages
     not_languages = "" if not_languages == "-" else not_languages
-    language_list = languages.split(",")
-    not_language_list = not_languages.split(",")
+    # dedupe while keeping order, since strict mode iterates this list
+    language_list = list(dict.fromkeys(languages.split(",")))
+    not_language_set = frozenset(not_languages.split(","))
     id_list = ids.split(",")
     output = output_jsonl if output_format == "jsonl" else output_csv
     delimiter = "\t" if delimiter == "tab" else delimiter
@@ -215,36 +220,47 @@ def main(
 
     # formulate a list of all valid instance-of classes
     parent_wikidata_id = conll_type_to_wikidata_id[conll_type]
-    subclass_dict = subclasses.find_one({"id": parent_wikidata_id})
+    subclass_dict = subclasses.find_one(
+        {"id": parent_wikidata_id}, projection={"subclasses": 1, "_id": 0}
+    )
     valid_instance_ofs = subclass_dict["subclasses"]
 
     # fetch results from mongodb
-    filter_dict = defaultdict(dict)
-    filter_dict["instance_of"].update({"$in": valid_instance_ofs})
+    filter_dict = {"instance_of": {"$in": valid_instance_ofs}}
 
     if languages:
-        filter_dict["languages"].update({"$in": language_list})
+        filter_dict["languages"] = {"$in": language_list}
 
     if ids:
-        filter_dict["id"].update({"$in": id_list})
-
-    results = (doc for doc in db.find(filter_dict))
+        filter_dict["id"] = {"$in": id_list}
+
+    # cap the cursor server-side as well, so mongo does not ship documents
+    # we would never output. pymongo treats limit=0 as "no limit", hence
+    # islice still enforces the cutoff (including num_docs == 0) locally.
+    limit = None if num_docs == math.inf else int(num_docs)
+    results = db.find(filter_dict, limit=limit or 0)
+
+    # throttle progress updates and skip them entirely when not on a terminal
+    progress = tqdm(
+        enumerate(itertools.islice(results, limit)),
+        disable=not sys.stderr.isatty(),
+        mininterval=1.0,
+        miniters=50000,
+        smoothing=0,
+    )
 
     with resolve_output_file(output_file) as fout:
-        for ix, doc in tqdm(enumerate(results)):
-            if ix < num_docs:
-                output(
-                    w.WikidataRecord(doc, simple=True),
-                    f=fout,
-                    languages=language_list,
-                    not_languages=not_language_list,
-                    conll_type=conll_type,
-                    strict=strict,
-                    row_number=ix,
-                    delimiter=delimiter,
-                )
-            else:
-                break
+        for ix, doc in progress:
+            output(
+                doc,
+                f=fout,
+                languages=language_list,
+                not_languages=not_language_set,
+                conll_type=conll_type,
+                strict=strict,
+                row_number=ix,
+                delimiter=delimiter,
+            )
 
 
 if __name__ == "__main__":
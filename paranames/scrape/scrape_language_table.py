@@ -4,7 +4,7 @@ import click
 import pandas as pd
 from qwikidata.sparql import return_sparql_query_results
 
-from paranames.util import orjson_dump
+from paranames.util import orjson_dump, orjson_dump_bytes
 
 
 def create_en_wikipedia_url(wikipedia_url: str):
@@ -84,9 +84,7 @@ def main(url, columns, african_only, abbrev_only, mapping_only, output_tsv):
     if abbrev_only:
         print("\n".join(df.lang_code.unique()))
     elif mapping_only:
-        out = {}
-        for row in df.to_dict(orient="records"):
-            out[row["lang_code"]] = row["language"]
+        out = dict(zip(df.lang_code, df.language))
         print(orjson_dump(out))
     elif output_tsv:
         with sys.stdout as stdout:
@@ -98,8 +96,10 @@ def main(url, columns, african_only, abbrev_only, mapping_only, output_tsv):
             )
 
     else:
-        for row in df.to_dict(orient="records"):
-            print(orjson_dump(row))
+        cols = list(df.columns)
+        buf = sys.stdout.buffer
+        for row in df.itertuples(index=False, name=None):
+            buf.write(orjson_dump_bytes(dict(zip(cols, row))) + b"\n")
 
 
 if __name__ == "__main__":
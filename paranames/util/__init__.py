@@ -9,6 +9,27 @@ import pandas as pd
 from tqdm import tqdm
 
 
+NA_VALUES = frozenset(
+    [
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "n/a",
+        "null",
+    ]
+)
+
+
 def maybe_infer_io_format(file_path: str, io_format: Optional[str] = None) -> str:
     if io_format:
         return io_format
@@ -30,25 +51,7 @@ def read(
             encoding="utf-8",
             delimiter="\t" if io_format == "tsv" else ",",
             chunksize=chunksize,
-            na_values=set(
-                [
-                    "#N/A",
-                    "#N/A N/A",
-                    "#NA",
-                    "-1.#IND",
-                    "-1.#QNAN",
-                    "-NaN",
-                    "1.#IND",
-                    "1.#QNAN",
-                    "<NA>",
-                    "N/A",
-                    "NA",
-                    "NULL",
-                    "NaN",
-                    "n/a",
-                    "null",
-                ]
-            ),
+            na_values=NA_VALUES,
             keep_default_na=False,
             names=column_names,
             **kwargs,
@@ -104,7 +107,13 @@ def write_pandas(
             index=index,
         )
     else:
-        return data.to_json(output_file, "records", encoding="utf-8", index=False)
+        with open(output_file, "wb") as f_out:
+            f_out.write(
+                orjson.dumps(
+                    data.to_dict(orient="records"),
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
 
 
 def write(
@@ -141,6 +150,16 @@ def orjson_dump(d: dict) -> str:
     return json_utf8
 
 
+def orjson_dump_bytes(d: dict) -> bytes:
+    """Dumps a dictionary to UTF-8 encoded bytes using orjson
+
+    Skips the decode step of `orjson_dump`, for callers that write to
+    binary streams such as `sys.stdout.buffer`.
+    """
+
+    return orjson.dumps(d)
+
+
 def json_dump(d: dict) -> str:
     """Dumps a dictionary in UTF-8 foprmat using json
 
@@ -150,15 +169,22 @@ def json_dump(d: dict) -> str:
     return json.dumps(d, ensure_ascii=False)
 
 
+try:
+    # Python 3.12+ ships a C implementation
+    from itertools import batched as _batched
+except ImportError:
+
+    def _batched(iterable, size):
+        it = iter(iterable)
+
+        while chunk := tuple(itertools.islice(it, size)):
+            yield chunk
+
+
 def chunks(iterable, size, should_enumerate=False):
-    """Source: https://alexwlchan.net/2018/12/iterating-in-fixed-size-chunks/"""
-    it = iter(iterable)
-    ix = 0
+    """Source: https://alexwlchan.net/2018/12/iterating-in-fixed-size-chunks/
 
-    while True:
-        chunk = tuple(itertools.islice(it, size))
+    Uses `itertools.batched` where available."""
+    batches = _batched(iterable, size)
 
-        if not chunk:
-            break
-        yield (ix, chunk) if should_enumerate else chunk
-        ix += 1
+    return enumerate(batches) if should_enumerate else batches
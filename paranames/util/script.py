@@ -5,6 +5,7 @@ import subprocess
 import tempfile as tf
 import unicodedata as ud
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Generator,
@@ -23,6 +24,8 @@ import pandas as pd
 from tqdm import tqdm
 from unicodeblock import blocks
 
+WORD_CACHE_MAX_SIZE = 1 << 18
+
 
 class UnicodeAnalyzer:
     def __init__(
@@ -37,17 +40,55 @@ class UnicodeAnalyzer:
         self.normalize_histogram = normalize_histogram
         self.ignore_numbers = ignore_numbers
 
-        # Skip punctuation depending on settings
-        self.punctuation_cond = (
-            lambda w: not self.is_punctuation(str(w))
+        # Per-character tables, filled in lazily as new characters show up.
+        # Each maps a character to its block/script, or to None if it is
+        # skipped. The *_skip dicts are the matching str.translate tables
+        # that delete skipped characters.
+        self._block_table: Dict[str, Optional[str]] = {}
+        self._block_skip: Dict[int, None] = {}
+        self._script_table: Dict[str, Optional[str]] = {}
+        self._script_skip: Dict[int, None] = {}
+
+        # The most common block/script of a word is memoized, since the same
+        # names recur across languages. Only the resulting strings are
+        # cached; the Counter-returning methods always build fresh ones.
+        self._cached_most_common_unicode_block = lru_cache(
+            maxsize=WORD_CACHE_MAX_SIZE
+        )(self._most_common_unicode_block)
+        self._cached_most_common_icu_script = lru_cache(
+            maxsize=WORD_CACHE_MAX_SIZE
+        )(self._most_common_icu_script)
+
+    def _kept_chars(
+        self,
+        word: str,
+        table: Dict[str, Optional[str]],
+        skip: Dict[int, None],
+        classify: Callable[[str], Optional[str]],
+    ) -> str:
+        """Classifies characters of `word` not seen before and returns
+        `word` with all skipped characters deleted."""
 
-            if self.ignore_punctuation
-            else True
-        )
+        for c in set(word).difference(table):
+            label = None if self.is_ignored(c) else classify(c)
+            table[c] = label or None
+
+            if not label:
+                skip[ord(c)] = None
 
-        # Skip digits depending on settings
-        self.digit_cond = (
-            lambda w: not self.is_number(str(w)) if self.ignore_numbers else True
+        return word.translate(skip)
+
+    def is_ignored(self, c: str) -> bool:
+        """Whether `c` is skipped as punctuation or a number under the
+        current settings. Looks up the Unicode category at most once."""
+
+        if not (self.ignore_punctuation or self.ignore_numbers):
+            return False
+
+        major_category = ud.category(c)[0]
+
+        return (self.ignore_punctuation and major_category in "PS") or (
+            self.ignore_numbers and major_category == "N"
         )
 
     def is_punctuation(self, s: str) -> bool:
@@ -75,19 +116,19 @@ class UnicodeAnalyzer:
 
     def unicode_blocks(self, word: str) -> Counter:
 
-        return Counter(
-            blocks.of(c)
-
-            for c in self.maybe_strip(word)
-
-            if blocks.of(c) and self.punctuation_cond(c) and self.digit_cond(c)
+        kept = self._kept_chars(
+            self.maybe_strip(word), self._block_table, self._block_skip, blocks.of
         )
 
+        return Counter(map(self._block_table.__getitem__, kept))
+
     def most_common_unicode_block(self, word: str) -> str:
-        try:
-            return self.unicode_blocks(word).most_common(1)[0][0]
-        except IndexError:
-            return ""
+        return self._cached_most_common_unicode_block(word)
+
+    def _most_common_unicode_block(self, word: str) -> str:
+        counts = self.unicode_blocks(word)
+
+        return max(counts, key=counts.__getitem__) if counts else ""
 
     def unicode_block_histogram(
         self,
@@ -100,21 +141,22 @@ class UnicodeAnalyzer:
 
     def icu_scripts(self, word: str) -> Counter:
 
-        return Counter(
-            self.get_icu_script(c)
-
-            for c in self.maybe_strip(word)
-
-            if self.get_icu_script(c)
-            and self.punctuation_cond(c)
-            and self.digit_cond(c)
+        kept = self._kept_chars(
+            self.maybe_strip(word),
+            self._script_table,
+            self._script_skip,
+            self.get_icu_script,
         )
 
+        return Counter(map(self._script_table.__getitem__, kept))
+
     def most_common_icu_script(self, word: str) -> str:
-        try:
-            return self.icu_scripts(word).most_common(1)[0][0]
-        except IndexError:
-            return ""
+        return self._cached_most_common_icu_script(word)
+
+    def _most_common_icu_script(self, word: str) -> str:
+        counts = self.icu_scripts(word)
+
+        return max(counts, key=counts.__getitem__) if counts else ""
 
     def icu_script_histogram(
         self,
@@ -1,14 +1,28 @@
+import itertools
 import math
 from typing import Generator, Set, List, Union, Dict, Any
 
 import orjson
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
 from tqdm import tqdm
 
 from paranames.util import orjson_dump
 
 
 class WikidataRecord:
+    __slots__ = (
+        "simple",
+        "record",
+        "default_lang",
+        "wikidata_id",
+        "mongo_id",
+        "instance_ofs",
+        "labels",
+        "_languages",
+        "_name",
+    )
+
     def __init__(
         self, record: dict, default_lang: str = "en", simple: bool = False
     ) -> None:
@@ -128,7 +142,6 @@ class WikidataMongoIngesterWorker:
         # reading-related attributes
         self.input_path = input_path
         self.start_at = start_at
-        self.next_read_at = start_at
         self.read_every = read_every
 
         # database-related attributes
@@ -137,12 +150,12 @@ class WikidataMongoIngesterWorker:
 
         # caching-related attributes
         self.cache_size = cache_size
-        self.cache_used = 0
         self.cache: List[Union[str, Dict[Any, Any]]] = []
 
         # misc attributes
         self.max_docs = max_docs
         self.n_decode_errors = 0
+        self.n_insert_errors = 0
         self.debug = debug
         self.simple_records = simple_records
 
@@ -156,9 +169,15 @@ class WikidataMongoIngesterWorker:
         if self.cache:
             if self.debug:
                 print(f"Worker {self.name} inserting to MongoDB...")
-            self.db.insert_many(self.cache)
+            # unordered so the server need not apply inserts one by one,
+            # and a failing document does not stop the rest of the batch
+            try:
+                self.db.insert_many(self.cache, ordered=False)
+            except BulkWriteError as e:
+                n_failed = len(e.details.get("writeErrors", []))
+                self.n_insert_errors += n_failed
+                print(f"Worker {self.name}: {n_failed} documents failed to insert")
             self.cache = []
-            self.cache_used = len(self.cache)
         else:
             print(f"Cache empty for worker {self.name}. Not writing...")
 
@@ -167,10 +186,10 @@ class WikidataMongoIngesterWorker:
         """The cache is defined to be full when its size
         is at least as large as self.cache_size."""
 
-        if self.cache_used >= self.cache_size:
+        if len(self.cache) >= self.cache_size:
             if self.debug:
                 print(
-                    f"Cache full for worker {self.name}. Used: {self.cache_used}, Size: {self.cache_size}"
+                    f"Cache full for worker {self.name}. Used: {len(self.cache)}, Size: {self.cache_size}"
                 )
 
             return True
@@ -179,6 +198,7 @@ class WikidataMongoIngesterWorker:
 
     def error_summary(self) -> None:
         print(f"Worker {self.name}, JSON decode errors: {self.n_decode_errors}")
+        print(f"Worker {self.name}, insert errors: {self.n_insert_errors}")
 
     def __call__(self) -> None:
         """Main method for invoking the read procedure.
@@ -188,37 +208,25 @@ class WikidataMongoIngesterWorker:
         caches the ingested lines, and bulk inserts them
         to a specified MongoDB collection as required."""
 
-        with open(self.input_path, encoding="utf-8") as f:
-            for line_nr, line in tqdm(enumerate(f, start=1)):
-
-                # if we're too early, skip
-
-                if line_nr < self.start_at:
-                    continue
-
-                # if we're past the max, stop
-
-                if line_nr > self.max_docs:
-                    self.write()
-
-                    break
+        # line numbers are 1-indexed; islice wants 0-indexed offsets
+        first_line = max(self.start_at, 1) - 1
+        last_line = None if self.max_docs == math.inf else int(self.max_docs)
 
-                # if we're exactly at the right spot, parse JSON
+        with open(self.input_path, encoding="utf-8") as f:
 
-                if line_nr == self.next_read_at:
-                    try:
-                        doc = orjson.loads(line.rstrip(",\n"))
-                        record = WikidataRecord(doc)
-                        self.cache.append(record.to_dict(simple=self.simple_records))
-                        self.cache_used += 1
-                    except orjson.JSONDecodeError:
-                        # in case of decode error, log it and keep going
-                        self.n_decode_errors += 1
+            # step through our own lines only, skipping the rest in C
+            lines = itertools.islice(f, first_line, last_line, self.read_every)
 
-                        continue
+            for line in tqdm(lines):
+                try:
+                    doc = orjson.loads(line.rstrip(",\n"))
+                    record = WikidataRecord(doc)
+                    self.cache.append(record.to_dict(simple=self.simple_records))
+                except orjson.JSONDecodeError:
+                    # in case of decode error, log it and keep going
+                    self.n_decode_errors += 1
 
-                    # in either case, take note of next line to read at
-                    self.next_read_at += self.read_every
+                    continue
 
                 # always write if our cache is full
 